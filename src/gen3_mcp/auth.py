@@ -1,5 +1,6 @@
 """Authentication management with token refresh."""
 
+import asyncio
 import json
 import logging
 import os
@@ -35,6 +36,8 @@ class AuthManager:
         self.http_client = http_client
         self._access_token: str | None = None
         self._token_expires_at: datetime | None = None
+        # Serializes refreshes so concurrent requests share one token fetch
+        self._refresh_lock = asyncio.Lock()
 
     async def get_valid_token(self) -> str:
         """Get a valid authentication token.
@@ -47,7 +50,10 @@ class AuthManager:
             Gen3MCPError: If token cannot be obtained.
         """
         if self._needs_refresh():
-            await self._refresh_token()
+            async with self._refresh_lock:
+                # Another caller may have refreshed it while we waited for the lock
+                if self._needs_refresh():
+                    await self._refresh_token()
 
         if not self._access_token:
             raise Gen3MCPError("No valid token available")
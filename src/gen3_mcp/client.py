@@ -8,7 +8,7 @@ import httpx
 
 from .auth import AuthManager
 from .config import Config, get_config
-from .consts import USER_AGENT
+from .consts import HTTP_KEEPALIVE_EXPIRY_SECONDS, USER_AGENT
 from .protocols import TokenProvider
 
 logger = logging.getLogger("gen3-mcp.client")
@@ -40,6 +40,11 @@ class Gen3Client:
         self.http_client = http_client or httpx.AsyncClient(
             headers={"User-Agent": USER_AGENT},
             timeout=self.config.timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=self.config.pool_size,
+                max_keepalive_connections=self.config.pool_size,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
             follow_redirects=True,
         )
 
@@ -102,6 +107,11 @@ class Gen3Client:
         logger.debug(f"POST {url} successful")
         return response.json()
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.http_client.aclose()
+        logger.info("Gen3 client closed")
+
 
 @cache
 def get_client() -> Gen3Client:
@@ -29,6 +29,22 @@ class Config(BaseSettings):
     timeout_seconds: int = Field(
         default=30, gt=0, le=300, description="HTTP request timeout in seconds"
     )
+    pool_size: int = Field(
+        default=100,
+        gt=0,
+        le=1000,
+        description="Maximum pooled HTTP connections to the Gen3 commons",
+    )
+    max_concurrent_queries: int = Field(
+        default=16,
+        gt=0,
+        le=1000,
+        description="Maximum GraphQL queries in flight to the Gen3 commons",
+    )
+    warmup_on_startup: bool = Field(
+        default=True,
+        description="Prefetch the schema when the server starts",
+    )
 
     @computed_field
     @property
@@ -13,3 +13,5 @@ SCHEMA_URL_PATH = "/api/v0/submission/_dictionary/_all"
 # Business logic consts
 TOKEN_REFRESH_BUFFER_MINUTES = 5  # refresh 5min early
 DEFAULT_TOKEN_EXPIRY_SECONDS = 1800  # 30 minutes
+VALIDATION_CACHE_SIZE = 256  # distinct query strings remembered by validate_query
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0  # close pooled connections idle this long
@@ -1,4 +1,5 @@
 from enum import StrEnum
+from functools import cached_property
 from typing import Any, Literal
 
 import httpx
@@ -214,6 +215,15 @@ class EntitySchema(BaseModel):
 class SchemaExtract(dict[str, EntitySchema]):
     """Schema extract containing entity definitions keyed by entity name."""
 
+    @cached_property
+    def entity_names(self) -> frozenset[str]:
+        """Entity names, computed once per extract.
+
+        The extract is not modified once built, so this can be reused as the
+        candidate pool for every entity name suggestion.
+        """
+        return frozenset(self)
+
     def to_json(self) -> dict[str, dict]:
         """Convert to JSON-serializable dict."""
         return {k: v.model_dump() for k, v in self.items()}
@@ -224,10 +234,13 @@ class SchemaExtract(dict[str, EntitySchema]):
         Fields are omitted from the summary to keep the response size manageable
         for MCP transport. Use get_schema_entity() to retrieve detailed field
         information for specific entities.
+
+        The summary is built once per extract and the same dict is returned on
+        every call, so callers must not modify it.
         """
-        result = {}
-        for k, v in self.items():
-            entity_data = v.model_dump()
-            entity_data.pop("fields", None)  # Remove fields key entirely
-            result[k] = entity_data
-        return result
+        return self._summary_json
+
+    @cached_property
+    def _summary_json(self) -> dict[str, dict]:
+        """Summary dict backing to_summary_json(), built on first use."""
+        return {k: v.model_dump(exclude={"fields"}) for k, v in self.items()}
@@ -1,26 +1,39 @@
 """GraphQL Query service for validation, building, and execution."""
 
+import asyncio
+import contextlib
 import logging
-from functools import cache
+from collections import OrderedDict
+from functools import cache, lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING
 
 import httpx
-from graphql import (
-    GraphQLSchema,
-    build_client_schema,
-    get_introspection_query,
-    parse,
-    validate,
-)
-from graphql.error import GraphQLError as NativeGraphQLError
-from graphql.error import GraphQLSyntaxError
 
+from .consts import VALIDATION_CACHE_SIZE
 from .exceptions import Gen3MCPError, GraphQLError, NoSuchEntityError
 from .schema import SchemaManager
 from .utils import suggest_similar_strings
 
+if TYPE_CHECKING:
+    from graphql import DocumentNode, GraphQLSchema
+
 logger = logging.getLogger("gen3-mcp.query")
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _parse_query(query: str) -> "DocumentNode":
+    """Parse a GraphQL query string, caching the AST per query string.
+
+    The AST is never modified after parsing so it is safe to share. Syntax
+    errors propagate and are not cached.
+    """
+    # graphql-core is imported on first use to keep server startup lean
+    from graphql import parse
+
+    return parse(query)
+
+
 class QueryService:
     """Query operations: validation, building, and execution."""
 
@@ -37,9 +50,21 @@ class QueryService:
         # Access client and config through schema_manager
         self.client = schema_manager.client
         self.config = schema_manager.client.config
-        self._graphql_schema = None
-
-    async def _get_graphql_schema(self) -> GraphQLSchema:
+        self._graphql_schema: GraphQLSchema | None = None
+        # Back-pressure: queries beyond the limit wait here rather than
+        # piling up on the Gen3 GraphQL endpoint
+        self._query_semaphore = asyncio.Semaphore(self.config.max_concurrent_queries)
+        # Requests for queries currently being executed, by query string
+        self._inflight_queries: dict[str, asyncio.Future[dict]] = {}
+        # Number of callers awaiting each in-flight request
+        self._inflight_waiters: dict[asyncio.Future[dict], int] = {}
+        # Serializes the introspection fetch so concurrent callers share it
+        self._graphql_schema_lock = asyncio.Lock()
+        # Validation error messages per query string, in LRU order. An empty
+        # list means the query is valid against the cached GraphQL schema.
+        self._validation_results: OrderedDict[str, list[str]] = OrderedDict()
+
+    async def _get_graphql_schema(self) -> "GraphQLSchema":
         """Get GraphQL introspection schema.
 
         This is cached separately from the data dictionary schema in schema_manager.
@@ -62,18 +87,39 @@ class QueryService:
             logger.debug("Using cached GraphQL introspection schema")
             return self._graphql_schema
 
+        async with self._graphql_schema_lock:
+            # Another caller may have fetched it while we waited for the lock
+            if self._graphql_schema is None:
+                self._graphql_schema = await self._fetch_graphql_schema()
+
+        return self._graphql_schema
+
+    async def _fetch_graphql_schema(self) -> "GraphQLSchema":
+        """Fetch the introspection result and build a GraphQL schema from it.
+
+        Returns:
+            GraphQLSchema instance for use with query validation.
+
+        Raises:
+            ConfigError: From auth if there is a config issue.
+            Gen3MCPError: If the introspection result cannot be built into a schema.
+            httpx.HTTPError: For HTTP/network errors during introspection.
+        """
         logger.info("Fetching GraphQL introspection schema")
 
+        from graphql import build_client_schema, get_introspection_query
+        from graphql.error import GraphQLError as NativeGraphQLError
+
         try:
             # Execute introspection query
             introspection_query = get_introspection_query()
             result = await self.execute_graphql(introspection_query)
 
-            # Build client schema from introspection result
-            schema = build_client_schema(result["data"])
+            # Build client schema from introspection result; CPU-bound, so
+            # keep it off the event loop
+            schema = await asyncio.to_thread(build_client_schema, result["data"])
 
-            logger.info("GraphQL introspection schema cached successfully")
-            self._graphql_schema = schema
+            logger.info("GraphQL introspection schema built successfully")
             return schema
 
         except (NativeGraphQLError, KeyError) as e:
@@ -91,6 +137,10 @@ class QueryService:
     async def execute_graphql(self, query: str) -> dict:
         """Execute GraphQL query.
 
+        Identical queries already in flight share a single request and its
+        result (or error) instead of each hitting the endpoint. The request
+        is cancelled only once every caller sharing it has been cancelled.
+
         Args:
             query: GraphQL query string.
 
@@ -102,14 +152,42 @@ class QueryService:
             httpx.HTTPError: For HTTP/network errors during GraphQL execution.
             GraphQLError: For GraphQL validation/execution failures.
         """
+        task = self._inflight_queries.get(query)
+        if task is None:
+            task = asyncio.ensure_future(self._execute_graphql(query))
+            self._inflight_queries[query] = task
+            task.add_done_callback(lambda _: self._inflight_queries.pop(query, None))
+        else:
+            logger.debug("Joining identical in-flight GraphQL query")
+
+        self._inflight_waiters[task] = self._inflight_waiters.get(task, 0) + 1
+        try:
+            # Shielded so one caller giving up does not cancel the others' request
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # The last caller giving up abandons the request itself, and waits
+            # for it to unwind so it cannot outlive the caller
+            if self._inflight_waiters[task] == 1 and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+            raise
+        finally:
+            self._inflight_waiters[task] -= 1
+            if not self._inflight_waiters[task]:
+                del self._inflight_waiters[task]
+
+    async def _execute_graphql(self, query: str) -> dict:
+        """Send a GraphQL query to the endpoint; see execute_graphql."""
         logger.info("Executing GraphQL query")
         logger.debug(f"Query: {query[:200]}{'...' if len(query) > 200 else ''}")
 
         try:
-            data = await self.client.post_json(
-                self.config.graphql_url,
-                json={"query": query},
-            )
+            async with self._query_semaphore:
+                data = await self.client.post_json(
+                    self.config.graphql_url,
+                    json={"query": query},
+                )
             logger.debug("GraphQL query executed successfully")
             return data
 
@@ -174,7 +252,7 @@ class QueryService:
             # Suggest similar entity names
             suggestions = suggest_similar_strings(
                 entity_name,
-                set(schema_extract.keys()),
+                schema_extract.entity_names,
                 threshold=0.5,
                 max_results=3,
             )
@@ -196,8 +274,9 @@ class QueryService:
 
         # Build template fields
         required = entity.schema_summary.required_fields
-        relations = list(entity.relationships)
-        basic_fields = ["id"] + [f for f in required if f not in relations]
+        # Required links are relationships, not scalar fields; test membership
+        # against the relationships dict directly rather than a per-call copy.
+        basic_fields = ["id"] + [f for f in required if f not in entity.relationships]
         remaining_slots = max_fields - len(basic_fields)
         template_fields = (
             basic_fields
@@ -212,7 +291,7 @@ class QueryService:
 
         # Add relationship examples
         if include_relationships:
-            for rel_name, _rel in list(entity.relationships.items())[:5]:
+            for rel_name in islice(entity.relationships, 5):
                 template_lines.extend(
                     [
                         f"    {rel_name} {{",
@@ -238,11 +317,13 @@ class QueryService:
             "max_fields_used": max_fields,
         }
 
-    async def validate_query(self, query: str) -> None:
+    async def validate_query(self, query: str, fail_fast: bool = False) -> None:
         """Validate GraphQL query.
 
         Args:
             query: GraphQL query string to validate.
+            fail_fast: Stop at the first validation error and report only that,
+                rather than collecting every error in the query.
 
         Returns:
             None: Validation functions follow the Pythonic pattern of returning None on
@@ -255,9 +336,60 @@ class QueryService:
         """
         logger.info("Validating GraphQL query")
 
+        messages = self._validation_results.get(query)
+        if messages is None:
+            messages = await self._validate_uncached(query, fail_fast)
+            # A fail-fast run that found errors stopped early; don't cache it
+            # as the complete result.
+            if not (fail_fast and messages):
+                self._validation_results[query] = messages
+                if len(self._validation_results) > VALIDATION_CACHE_SIZE:
+                    self._validation_results.popitem(last=False)
+        else:
+            self._validation_results.move_to_end(query)
+            logger.debug("Using cached validation result")
+
+        if fail_fast:
+            messages = messages[:1]
+
+        if messages:
+            logger.warning(f"GraphQL validation failed with {len(messages)} errors")
+
+            raise GraphQLError(
+                f"GraphQL query validation failed with {len(messages)} errors",
+                errors=list(messages),
+                suggestions=[
+                    "Use generate_query_template() for valid query examples",
+                ],
+                context={
+                    "query": query,
+                    "error_count": len(messages),
+                },
+            )
+
+        logger.info("GraphQL validation successful")
+
+    async def _validate_uncached(self, query: str, fail_fast: bool) -> list[str]:
+        """Parse and validate a query against the GraphQL schema.
+
+        Args:
+            query: GraphQL query string to validate.
+            fail_fast: Abort graphql-core validation after the first error.
+
+        Returns:
+            Validation error messages; empty if the query is valid.
+
+        Raises:
+            ConfigError: From auth if there is a config issue.
+            httpx.HTTPError: For HTTP/network errors during API calls.
+            GraphQLError: If the query has a syntax error.
+        """
+        from graphql import validate
+        from graphql.error import GraphQLSyntaxError
+
         try:
             # Parse the query into AST
-            query_ast = parse(query)
+            query_ast = _parse_query(query)
             logger.debug("GraphQL query parsed successfully")
 
         except GraphQLSyntaxError as e:
@@ -280,28 +412,26 @@ class QueryService:
         schema = await self._get_graphql_schema()
 
         # Validate query against schema
-        errors = validate(schema, query_ast)
+        errors = validate(schema, query_ast, max_errors=1 if fail_fast else None)
+        return [error.message for error in errors]
 
-        if errors:
-            logger.warning(f"GraphQL validation failed with {len(errors)} errors")
+    async def prefetch_graphql_schema(self) -> None:
+        """Fetch and cache the GraphQL introspection schema ahead of first use.
 
-            raise GraphQLError(
-                f"GraphQL query validation failed with {len(errors)} errors",
-                errors=errors,
-                suggestions=[
-                    "Use generate_query_template() for valid query examples",
-                ],
-                context={
-                    "query": query,
-                    "error_count": len(errors),
-                },
-            )
-
-        logger.info("GraphQL validation successful")
+        Raises:
+            ConfigError: From auth if there is a config issue.
+            Gen3MCPError: If the introspection result cannot be built into a schema.
+            httpx.HTTPError: For HTTP/network errors during introspection.
+        """
+        await self._get_graphql_schema()
 
     def clear_graphql_schema_cache(self):
-        """Clear cached GraphQL schema. Useful for testing and cache invalidation."""
+        """Clear cached GraphQL schema. Useful for testing and cache invalidation.
+
+        Cached validation results depend on the schema so are cleared too.
+        """
         self._graphql_schema = None
+        self._validation_results.clear()
         logger.debug("GraphQL schema cache cleared")
 
 
@@ -1,5 +1,6 @@
 """Manager providing Gen3 schema operations and caching."""
 
+import asyncio
 import logging
 from functools import cache
 from typing import Any
@@ -37,8 +38,11 @@ class SchemaManager:
         self.client = client
         # Access config through client
         self.config = client.config
-        self._full_schema = None
-        self._schema_extract = None
+        self._full_schema: dict[str, Any] | None = None
+        self._schema_extract: SchemaExtract | None = None
+        # Serialize cache fills so concurrent first calls fetch only once
+        self._full_schema_lock = asyncio.Lock()
+        self._schema_extract_lock = asyncio.Lock()
 
     async def get_schema_full(self) -> dict[str, Any]:
         """Get full schema using config.schema_url.
@@ -54,12 +58,16 @@ class SchemaManager:
             logger.debug("Using cached full schema")
             return self._full_schema
 
-        logger.info(f"Fetching full schema from {self.config.schema_url}")
+        async with self._full_schema_lock:
+            # Another caller may have fetched it while we waited for the lock
+            if self._full_schema is None:
+                logger.info(f"Fetching full schema from {self.config.schema_url}")
+
+                schema = await self.client.get_json(self.config.schema_url)
+                logger.info("Fetched full schema")
+                self._full_schema = schema
 
-        schema = await self.client.get_json(self.config.schema_url)
-        logger.info("Fetched full schema")
-        self._full_schema = schema
-        return schema
+        return self._full_schema
 
     async def get_schema_extract(self) -> SchemaExtract:
         """Get processed schema extract with relationships and annotations.
@@ -77,17 +85,22 @@ class SchemaManager:
             logger.debug("Using cached schema extract")
             return self._schema_extract
 
-        logger.info("Creating new schema extract")
+        async with self._schema_extract_lock:
+            # Another caller may have built it while we waited for the lock
+            if self._schema_extract is None:
+                logger.info("Creating new schema extract")
 
-        # Get the full schema (may raise ConfigError, httpx errors)
-        schema = await self.get_schema_full()
+                # Get the full schema (may raise ConfigError, httpx errors)
+                schema = await self.get_schema_full()
 
-        # Process it (may raise ParseError)
-        extract = self._create_extract(schema)
+                # Process it (may raise ParseError); CPU-bound, so keep it
+                # off the event loop
+                extract = await asyncio.to_thread(self._create_extract, schema)
 
-        logger.info("Created new schema extract")
-        self._schema_extract = extract
-        return extract
+                logger.info("Created new schema extract")
+                self._schema_extract = extract
+
+        return self._schema_extract
 
     async def get_entity(self, entity_name: str) -> EntitySchema:
         """Get a specific entity from the schema extract.
@@ -112,7 +125,7 @@ class SchemaManager:
 
             suggestions = suggest_similar_strings(
                 entity_name,
-                set(schema_extract.keys()),
+                schema_extract.entity_names,
                 threshold=0.5,
                 max_results=3,
             )
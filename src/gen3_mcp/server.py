@@ -1,9 +1,13 @@
 """Gen3 MCP server implementation."""
 
+import asyncio
+import contextlib
 import logging
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 
+from .client import get_client
 from .config import get_config
 from .consts import SERVER_NAME
 from .models import Response
@@ -12,6 +16,50 @@ from .schema import get_schema_manager
 
 logger = logging.getLogger("gen3-mcp.server")
 
+
+async def _warmup() -> None:
+    """Prefetch both schemas so the first tool calls do not wait for them.
+
+    The data dictionary and the GraphQL introspection schema are independent
+    fetches, so they run concurrently.
+    """
+    results = await asyncio.gather(
+        get_schema_manager().get_schema_extract(),
+        get_query_service().prefetch_graphql_schema(),
+        return_exceptions=True,
+    )
+    failures = [str(r) for r in results if isinstance(r, Exception)]
+    if failures:
+        # Not fatal: the first tool call retries and reports the error
+        logger.warning(f"Schema warmup failed: {'; '.join(failures)}")
+    else:
+        logger.info("Schema warmup complete")
+
+
+async def _serve() -> None:
+    """Serve MCP over stdio with process-wide startup and shutdown.
+
+    Schema warmup and the cached HTTP client belong to the process, not to a
+    FastMCP lifespan, which runs per Server.run (per session, or per request
+    when stateless). Warmup runs in the background so it never delays the
+    MCP handshake; tool calls that arrive first simply wait on the same fetch.
+    """
+    warmup = None
+    if get_config().warmup_on_startup:
+        warmup = asyncio.create_task(_warmup())
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        if warmup is not None:
+            # Let the warmup unwind its requests before the client is closed
+            warmup.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await warmup
+        # Only close a client that was actually created
+        if get_client.cache_info().currsize:
+            await get_client().aclose()
+
+
 mcp = FastMCP(
     name=SERVER_NAME,
     instructions="""
@@ -151,7 +199,7 @@ async def generate_query_template(
 
 
 @mcp.tool()
-async def validate_query(query: str) -> Response:
+async def validate_query(query: str, fail_fast: bool = False) -> Response:
     """Check if your GraphQL query is valid before executing it.
 
     Validates your GraphQL query syntax and verifies that all entities and
@@ -161,6 +209,7 @@ async def validate_query(query: str) -> Response:
 
     Args:
         query: The GraphQL query string to validate
+        fail_fast: Stop at the first error - use for a quick yes/no check
 
     Returns:
         Validation results with detailed error messages and fix suggestions
@@ -178,7 +227,7 @@ async def validate_query(query: str) -> Response:
     try:
         service = get_query_service()
         # validate_query returns None on success (void pattern)
-        await service.validate_query(query)
+        await service.validate_query(query, fail_fast)
 
         return Response(
             status="success",
@@ -235,8 +284,20 @@ async def execute_graphql(query: str) -> Response:
 
 
 def main() -> None:
-    """Run the MCP server."""
-    mcp.run(transport="stdio")
+    """Run the MCP server.
+
+    The event loop is uvloop when available (install the `uvloop` extra),
+    otherwise the default asyncio loop.
+    """
+    backend_options = {}
+    try:
+        import uvloop  # type: ignore[import-not-found]  # noqa: F401
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+    else:
+        backend_options["use_uvloop"] = True
+
+    anyio.run(_serve, backend_options=backend_options)
 
 
 if __name__ == "__main__":
@@ -1,22 +1,40 @@
 """Utility functions for string similarity and suggestions."""
 
+import heapq
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _casefolded(candidates: frozenset[str]) -> tuple[tuple[str, str], ...]:
+    """Pair each candidate with its casefolded form.
+
+    Candidate pools (e.g. the entity names of a schema) are reused across
+    many suggestion calls, so the case folding is done once per pool.
+    """
+    return tuple((candidate, candidate.casefold()) for candidate in candidates)
+
 
 def suggest_similar_strings(
     target: str,
-    candidates: set[str] | list[str],
+    candidates: set[str] | frozenset[str] | list[str],
     threshold: float = 0.6,
     max_results: int = 3,
 ) -> list[str]:
     """Suggest similar strings using basic similarity scoring.
 
+    Matching is caseless: strings are compared in casefolded form.
+
     Args:
         target: String to match against.
-        candidates: Set or list of candidate strings.
+        candidates: Set, frozenset or list of candidate strings. Passing the
+            same frozenset on repeated calls lets its normalization and
+            results be reused.
         threshold: Minimum similarity threshold (0.0 to 1.0).
         max_results: Maximum number of suggestions to return.
 
     Returns:
-        List of similar strings, sorted by similarity (highest first).
+        List of similar strings, sorted by similarity (highest first), with
+        equally similar strings in alphabetical order.
 
     Raises:
         Could theoretically raise:
@@ -24,14 +42,51 @@ def suggest_similar_strings(
         - ValueError: If threshold is not numeric
         (In practice, these would indicate programming errors)
     """
+    if not isinstance(candidates, frozenset):
+        candidates = frozenset(candidates)
+    return list(_suggest(target, candidates, threshold, max_results))
+
+
+@lru_cache(maxsize=256)
+def _suggest(
+    target: str, candidates: frozenset[str], threshold: float, max_results: int
+) -> tuple[str, ...]:
+    """Rank candidates by similarity to target; see suggest_similar_strings.
+
+    Memoized: the same typo against the same pool is only scored once.
+    """
     from difflib import SequenceMatcher
 
-    suggestions = []
-    for candidate in candidates:
-        similarity = SequenceMatcher(None, target.lower(), candidate.lower()).ratio()
-        if similarity >= threshold:
-            suggestions.append((candidate, similarity))
+    # ratio() is not symmetric: the target must stay the first sequence and
+    # each candidate the second, as in SequenceMatcher(None, target, candidate).
+    matcher = SequenceMatcher()
+    matcher.set_seq1(target.casefold())
+
+    # Min-heap of the best max_results similarities found so far. Once full,
+    # its weakest score becomes the cutoff later candidates must reach,
+    # tightening the cheap bounds below. Candidates tying the cutoff still
+    # pass, so ties can be broken deterministically at the end.
+    top_scores: list[float] = []
+    found: list[tuple[float, str]] = []
+    cutoff = threshold
+    for candidate, candidate_folded in _casefolded(candidates):
+        matcher.set_seq2(candidate_folded)
+        # Cheap upper bounds on ratio(): lengths alone, then shared characters.
+        if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+            continue
+        similarity = matcher.ratio()
+        if similarity < cutoff:
+            continue
+
+        found.append((similarity, candidate))
+        if len(top_scores) < max_results:
+            heapq.heappush(top_scores, similarity)
+        else:
+            heapq.heappushpop(top_scores, similarity)
+        if top_scores and len(top_scores) >= max_results:
+            cutoff = top_scores[0]
 
-    # Sort by similarity (descending) and return just the strings
-    suggestions.sort(key=lambda x: x[1], reverse=True)
-    return [s[0] for s in suggestions[:max_results]]
+    # Highest similarity first; equal scores in alphabetical order, so the
+    # result does not depend on set iteration order
+    best = heapq.nsmallest(max_results, found, key=lambda entry: (-entry[0], entry[1]))
+    return tuple(candidate for _, candidate in best)
@@ -0,0 +1,31 @@
+"""Tests for AuthManager"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from gen3_mcp.auth import AuthManager
+from gen3_mcp.config import Config
+
+
+class TestGetValidToken:
+    """Test token retrieval and refresh"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_happens_once(self):
+        """Test concurrent callers needing a token share a single refresh"""
+        manager = AuthManager(Config(), Mock())
+
+        async def slow_refresh():
+            await asyncio.sleep(0.01)  # let the other callers reach the lock
+            manager._access_token = "fresh_token"
+            manager._token_expires_at = datetime.now(UTC) + timedelta(hours=1)
+
+        manager._refresh_token = AsyncMock(side_effect=slow_refresh)
+
+        tokens = await asyncio.gather(*(manager.get_valid_token() for _ in range(5)))
+
+        assert tokens == ["fresh_token"] * 5
+        manager._refresh_token.assert_awaited_once()
@@ -229,6 +229,15 @@ class TestGen3Client:
                 "https://test.gen3.io/graphql", json={"query": "{ invalid }"}
             )
 
+    @pytest.mark.asyncio
+    async def test_aclose(self, client_with_mocks, mock_http_client):
+        """Test aclose closes the underlying HTTP client"""
+        mock_http_client.aclose = AsyncMock()
+
+        await client_with_mocks.aclose()
+
+        mock_http_client.aclose.assert_awaited_once()
+
 
 class TestClientIntegration:
     """Integration tests for client with other components"""
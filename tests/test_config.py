@@ -22,6 +22,9 @@ class TestConfig:
         assert clean_config.log_level == "INFO"
         assert clean_config.credentials_file == "~/credentials.json"
         assert clean_config.timeout_seconds == 30
+        assert clean_config.pool_size == 100
+        assert clean_config.max_concurrent_queries == 16
+        assert clean_config.warmup_on_startup is True
 
         # Test computed properties
         assert clean_config.auth_url.endswith(AUTH_URL_PATH)
@@ -98,6 +101,28 @@ class TestConfig:
         with pytest.raises(ValidationError):
             Config(timeout_seconds=500)
 
+    def test_pool_size_validation(self):
+        """Test HTTP pool size validation"""
+        config = Config(pool_size=10)
+        assert config.pool_size == 10
+
+        with pytest.raises(ValidationError):
+            Config(pool_size=0)
+
+        with pytest.raises(ValidationError):
+            Config(pool_size=5000)
+
+    def test_max_concurrent_queries_validation(self):
+        """Test max concurrent queries validation"""
+        config = Config(max_concurrent_queries=4)
+        assert config.max_concurrent_queries == 4
+
+        with pytest.raises(ValidationError):
+            Config(max_concurrent_queries=0)
+
+        with pytest.raises(ValidationError):
+            Config(max_concurrent_queries=5000)
+
     def test_env_vars_isolated_from_defaults(self, clean_env):
         """Test that environment variables don't affect default testing"""
         # This test runs with clean_env, so should see defaults
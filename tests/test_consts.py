@@ -1,6 +1,7 @@
 from gen3_mcp.consts import (
     AUTH_URL_PATH,
     GRAPHQL_URL_PATH,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
     PACKAGE_VERSION,
     SCHEMA_URL_PATH,
     SERVER_NAME,
@@ -39,3 +40,7 @@ class TestPackageConstants:
         assert "credentials" in AUTH_URL_PATH
         assert "graphql" in GRAPHQL_URL_PATH
         assert "dictionary" in SCHEMA_URL_PATH
+
+    def test_http_keepalive_expiry(self):
+        """Test that HTTP keepalive expiry is positive"""
+        assert HTTP_KEEPALIVE_EXPIRY_SECONDS > 0
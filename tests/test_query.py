@@ -1,12 +1,14 @@
 """Comprehensive tests for QueryService module"""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import httpx
 import pytest
 
 from gen3_mcp.exceptions import GraphQLError, NoSuchEntityError
-from gen3_mcp.query import QueryService, get_query_service
+from gen3_mcp.models import Response
+from gen3_mcp.query import QueryService, _parse_query, get_query_service
 from gen3_mcp.schema import SchemaManager
 
 
@@ -94,6 +96,124 @@ class TestExecuteGraphQL:
         assert "errors" in result
         assert "Syntax error in query" in result["errors"]
 
+    @pytest.mark.asyncio
+    async def test_execute_graphql_concurrency_bounded(self, schema_manager):
+        """Test concurrent queries beyond max_concurrent_queries wait their turn"""
+        schema_manager.client.config.max_concurrent_queries = 2
+        service = QueryService(schema_manager)
+        in_flight = peak = 0
+
+        async def slow_post_json(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"data": {}}
+
+        service.client.post_json = AsyncMock(side_effect=slow_post_json)
+
+        await asyncio.gather(
+            *(service.execute_graphql(f"{{ subject {{ f{i} }} }}") for i in range(5))
+        )
+
+        assert peak == 2
+        assert service.client.post_json.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_execute_graphql_identical_queries_coalesced(self, schema_manager):
+        """Test identical concurrent queries share one request"""
+        service = QueryService(schema_manager)
+
+        async def slow_post_json(url, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"data": {"query": kwargs["json"]["query"]}}
+
+        service.client.post_json = AsyncMock(side_effect=slow_post_json)
+
+        results = await asyncio.gather(
+            service.execute_graphql("{ subject { id } }"),
+            service.execute_graphql("{ subject { id } }"),
+            service.execute_graphql("{ subject { type } }"),
+        )
+
+        assert results[0] == results[1] == {"data": {"query": "{ subject { id } }"}}
+        assert results[2] == {"data": {"query": "{ subject { type } }"}}
+        assert service.client.post_json.await_count == 2
+        assert not service._inflight_queries
+
+        # Once finished, the same query is sent again
+        await service.execute_graphql("{ subject { id } }")
+        assert service.client.post_json.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_graphql_shared_request_survives_one_cancel(
+        self, schema_manager
+    ):
+        """Test cancelling one caller leaves the shared request for the others"""
+        service = QueryService(schema_manager)
+
+        async def slow_post_json(url, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"data": {}}
+
+        service.client.post_json = AsyncMock(side_effect=slow_post_json)
+
+        first = asyncio.create_task(service.execute_graphql("{ subject { id } }"))
+        second = asyncio.create_task(service.execute_graphql("{ subject { id } }"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == {"data": {}}
+        assert first.cancelled()
+        service.client.post_json.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_graphql_last_cancel_cancels_request(self, schema_manager):
+        """Test cancelling every caller cancels the shared request too"""
+        service = QueryService(schema_manager)
+        request_cancelled = asyncio.Event()
+
+        async def hanging_post_json(url, **kwargs):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                request_cancelled.set()
+                raise
+
+        service.client.post_json = AsyncMock(side_effect=hanging_post_json)
+
+        caller = asyncio.create_task(service.execute_graphql("{ subject { id } }"))
+        await asyncio.sleep(0)
+        caller.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        # The request has unwound by the time the caller's cancellation lands
+        assert request_cancelled.is_set()
+        assert not service._inflight_queries
+        assert not service._inflight_waiters
+
+    @pytest.mark.asyncio
+    async def test_execute_graphql_coalesced_error_raised_to_all(self, schema_manager):
+        """Test an error from a shared request is raised to every caller"""
+        service = QueryService(schema_manager)
+
+        async def failing_post_json(url, **kwargs):
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("Connection failed")
+
+        service.client.post_json = AsyncMock(side_effect=failing_post_json)
+
+        results = await asyncio.gather(
+            service.execute_graphql("{ subject { id } }"),
+            service.execute_graphql("{ subject { id } }"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, httpx.ConnectError) for r in results)
+        service.client.post_json.assert_awaited_once()
+
 
 class TestGenerateQueryTemplate:
     """Test generate_query_template method"""
@@ -234,6 +354,143 @@ class TestValidateQuery:
             error.errors
         )
 
+    @pytest.mark.asyncio
+    async def test_validate_query_errors_are_messages(self, query_service):
+        """Test validation errors are collected as plain message strings"""
+        query = "{ subject { invalid_field other_invalid_field } }"
+
+        with pytest.raises(GraphQLError) as exc_info:
+            await query_service.validate_query(query)
+
+        error = exc_info.value
+        assert len(error.errors) == 2
+        assert all(isinstance(message, str) for message in error.errors)
+
+        # Must be usable in the unified Response model
+        response = Response.from_error(error)
+        assert response.errors == error.errors
+
+
+class TestValidateQueryFailFast:
+    """Test validate_query in fail-fast mode"""
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_reports_first_error(self, query_service):
+        """Test fail-fast mode stops at the first validation error"""
+        query = "{ subject { invalid_field other_invalid_field } }"
+
+        with pytest.raises(GraphQLError) as exc_info:
+            await query_service.validate_query(query, fail_fast=True)
+
+        assert len(exc_info.value.errors) == 1
+        assert "invalid_field" in exc_info.value.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_result_not_cached_as_complete(self, query_service):
+        """Test a later full validation still reports every error"""
+        query = "{ subject { invalid_field other_invalid_field } }"
+
+        with pytest.raises(GraphQLError):
+            await query_service.validate_query(query, fail_fast=True)
+        with pytest.raises(GraphQLError) as exc_info:
+            await query_service.validate_query(query)
+
+        assert len(exc_info.value.errors) == 2
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_valid_query(self, query_service):
+        """Test fail-fast mode passes valid queries"""
+        assert await query_service.validate_query("{ subject { id } }", True) is None
+
+
+class TestValidationCache:
+    """Test caching of validate_query results"""
+
+    @pytest.mark.asyncio
+    async def test_valid_query_cached(self, query_service):
+        """Test a query that validated once is not validated again"""
+        query = "{ subject { id } }"
+
+        await query_service.validate_query(query)
+        await query_service.validate_query(query)
+
+        query_service._get_graphql_schema.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_query_cached(self, query_service):
+        """Test a failing query reports the same errors without revalidating"""
+        query = "{ subject { invalid_field } }"
+
+        raised = []
+        for _ in range(2):
+            with pytest.raises(GraphQLError) as exc_info:
+                await query_service.validate_query(query)
+            raised.append(exc_info.value)
+
+        assert raised[0].errors == raised[1].errors
+        assert raised[0].errors is not raised[1].errors
+        query_service._get_graphql_schema.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_clear_schema_cache_clears_validation_cache(self, query_service):
+        """Test clearing the GraphQL schema cache forces revalidation"""
+        query = "{ subject { id } }"
+
+        await query_service.validate_query(query)
+        query_service.clear_graphql_schema_cache()
+        await query_service.validate_query(query)
+
+        assert query_service._get_graphql_schema.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_parsed_query_cached(self, query_service):
+        """Test a query string is only parsed once across validations"""
+        _parse_query.cache_clear()
+        query = "{ subject { id } }"
+
+        await query_service.validate_query(query)
+        query_service.clear_graphql_schema_cache()
+        await query_service.validate_query(query)
+
+        assert _parse_query.cache_info().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_validation_cache_bounded(self, query_service, monkeypatch):
+        """Test the least recently used query is evicted when the cache is full"""
+        monkeypatch.setattr("gen3_mcp.query.VALIDATION_CACHE_SIZE", 2)
+
+        for field in ("id", "submitter_id", "type"):
+            await query_service.validate_query(f"{{ subject {{ {field} }} }}")
+
+        assert list(query_service._validation_results) == [
+            "{ subject { submitter_id } }",
+            "{ subject { type } }",
+        ]
+
+
+class TestGraphQLSchemaCache:
+    """Test the cached GraphQL introspection schema"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_access_fetches_once(
+        self, schema_manager, mock_graphql_schema
+    ):
+        """Test concurrent first calls share a single introspection fetch"""
+
+        async def slow_fetch():
+            await asyncio.sleep(0.01)  # let the other callers reach the cache
+            return mock_graphql_schema
+
+        service = QueryService(schema_manager)
+        service._fetch_graphql_schema = AsyncMock(side_effect=slow_fetch)
+
+        results = await asyncio.gather(
+            *(service._get_graphql_schema() for _ in range(3))
+        )
+
+        assert all(result is mock_graphql_schema for result in results)
+        service._fetch_graphql_schema.assert_awaited_once()
+
 
 class TestEntitySuggestionIntegration:
     """Test entity suggestion integration in query context"""
@@ -108,6 +108,20 @@ class TestSchemaExtract:
             assert "relationships" in entity_data
             assert "schema_summary" in entity_data
 
+    @pytest.mark.asyncio
+    async def test_to_summary_json_method(self, schema_extract):
+        """Test the summary omits fields and is built only once"""
+        summary = schema_extract.to_summary_json()
+
+        assert set(summary) == set(schema_extract)
+        for entity_name, entity_data in summary.items():
+            assert "fields" not in entity_data
+            assert entity_data["name"] == entity_name
+            assert "relationships" in entity_data
+            assert "schema_summary" in entity_data
+
+        assert schema_extract.to_summary_json() is summary
+
     @pytest.mark.asyncio
     async def test_dict_interface(self, schema_extract):
         """Test that SchemaExtract works as a dict"""
@@ -131,6 +145,12 @@ class TestSchemaExtract:
         assert isinstance(schema_extract, dict)
         assert isinstance(schema_extract, SchemaExtract)
 
+    @pytest.mark.asyncio
+    async def test_entity_names(self, schema_extract):
+        """Test entity_names is a frozenset computed once per extract"""
+        assert schema_extract.entity_names == frozenset(schema_extract.keys())
+        assert schema_extract.entity_names is schema_extract.entity_names
+
     def test_empty_extract_creation(self):
         """Test creating empty SchemaExtract"""
         extract = SchemaExtract()
@@ -310,3 +330,24 @@ class TestSchemaManagerBehavior:
 
         # All should be the same instance (cached)
         assert results[0] is results[1] is results[2]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_access_fetches_once(self, mock_client):
+        """Test concurrent first calls share a single schema fetch"""
+        import asyncio
+
+        fetch_json = mock_client.get_json.side_effect
+
+        async def slow_get_json(url, **kwargs):
+            await asyncio.sleep(0.01)  # let the other callers reach the cache
+            return fetch_json(url, **kwargs)
+
+        mock_client.get_json.side_effect = slow_get_json
+        manager = SchemaManager(mock_client)
+
+        results = await asyncio.gather(
+            *(manager.get_schema_extract() for _ in range(3))
+        )
+
+        assert results[0] is results[1] is results[2]
+        mock_client.get_json.assert_awaited_once()
@@ -0,0 +1,222 @@
+"""Tests for the MCP server entry point and startup warmup"""
+
+import asyncio
+import logging
+import sys
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from gen3_mcp import server
+from gen3_mcp.client import Gen3Client, get_client
+from gen3_mcp.config import Config
+from gen3_mcp.query import get_query_service
+from gen3_mcp.schema import get_schema_manager
+
+
+@pytest.fixture(autouse=True)
+def clean_singletons():
+    """Start and end each test without cached client or services"""
+
+    def clear():
+        get_query_service.cache_clear()
+        get_schema_manager.cache_clear()
+        get_client.cache_clear()
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.fixture
+def no_warmup(monkeypatch):
+    """Disable startup warmup"""
+    monkeypatch.setattr(server, "get_config", lambda: Config(warmup_on_startup=False))
+
+
+@pytest.fixture
+def with_warmup(monkeypatch):
+    """Enable startup warmup"""
+    monkeypatch.setattr(server, "get_config", lambda: Config(warmup_on_startup=True))
+
+
+@pytest.fixture
+def mock_services(monkeypatch):
+    """Replace the schema manager and query service seen by the server"""
+    manager = Mock()
+    manager.get_schema_extract = AsyncMock()
+    service = Mock()
+    service.prefetch_graphql_schema = AsyncMock()
+    monkeypatch.setattr(server, "get_schema_manager", lambda: manager)
+    monkeypatch.setattr(server, "get_query_service", lambda: service)
+    return manager, service
+
+
+@pytest.fixture
+def stdio(monkeypatch):
+    """Replace the stdio transport with a mock that serves for a moment"""
+
+    async def serve_briefly():
+        await asyncio.sleep(0.01)
+
+    run_stdio_async = AsyncMock(side_effect=serve_briefly)
+    monkeypatch.setattr(server.mcp, "run_stdio_async", run_stdio_async)
+    return run_stdio_async
+
+
+class TestWarmup:
+    """Test the startup schema warmup"""
+
+    @pytest.mark.asyncio
+    async def test_warmup_fetches_both_schemas(self, mock_services, caplog):
+        """Test warmup prefetches the data dictionary and introspection schema"""
+        manager, service = mock_services
+
+        with caplog.at_level(logging.INFO, logger="gen3-mcp.server"):
+            await server._warmup()
+
+        manager.get_schema_extract.assert_awaited_once()
+        service.prefetch_graphql_schema.assert_awaited_once()
+        assert "Schema warmup complete" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_warmup_failure_only_logged(self, mock_services, caplog):
+        """Test a failed fetch is logged rather than raised"""
+        manager, _ = mock_services
+        manager.get_schema_extract.side_effect = RuntimeError("schema unavailable")
+
+        with caplog.at_level(logging.WARNING, logger="gen3-mcp.server"):
+            await server._warmup()
+
+        assert "Schema warmup failed: schema unavailable" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_warmup_fetches_concurrently(self, mock_services):
+        """Test both fetches are in flight at once and a failure blocks neither"""
+        manager, service = mock_services
+        both_started = asyncio.Barrier(2)
+        completed = []
+
+        async def failing_extract():
+            await both_started.wait()
+            raise RuntimeError("schema unavailable")
+
+        async def introspection():
+            await both_started.wait()
+            await asyncio.sleep(0.01)  # still running after the other fails
+            completed.append("introspection")
+
+        manager.get_schema_extract.side_effect = failing_extract
+        service.prefetch_graphql_schema.side_effect = introspection
+
+        # Run sequentially, each fetch would wait at the barrier forever
+        await asyncio.wait_for(server._warmup(), timeout=1)
+
+        assert completed == ["introspection"]
+
+    @pytest.mark.asyncio
+    async def test_serve_runs_warmup(self, with_warmup, mock_services, stdio):
+        """Test serving starts the warmup when enabled"""
+        manager, service = mock_services
+
+        await server._serve()
+
+        manager.get_schema_extract.assert_awaited_once()
+        service.prefetch_graphql_schema.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_serve_warmup_disabled(self, no_warmup, mock_services, stdio):
+        """Test warmup_on_startup=False skips the warmup"""
+        manager, service = mock_services
+
+        await server._serve()
+
+        manager.get_schema_extract.assert_not_awaited()
+        service.prefetch_graphql_schema.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_mid_warmup_cancels_requests_first(
+        self, with_warmup, stdio, monkeypatch
+    ):
+        """Test in-flight warmup requests unwind before the client is closed"""
+        events = []
+
+        async def hanging_request(url, **kwargs):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                events.append(f"cancelled {url}")
+                raise
+
+        async def record_aclose(self):
+            events.append("closed")
+
+        monkeypatch.setattr(Gen3Client, "aclose", record_aclose)
+        client = get_client()
+        client.get_json = AsyncMock(side_effect=hanging_request)
+        client.post_json = AsyncMock(side_effect=hanging_request)
+
+        await server._serve()
+
+        assert sorted(events[:2]) == sorted(
+            [
+                f"cancelled {client.config.schema_url}",
+                f"cancelled {client.config.graphql_url}",
+            ]
+        )
+        assert events[2:] == ["closed"]
+
+
+class TestServe:
+    """Test the process-level serve entry point"""
+
+    @pytest.mark.asyncio
+    async def test_client_closed_at_exit(self, no_warmup, stdio):
+        """Test the shared client is closed once serving ends"""
+        client = get_client()
+
+        await server._serve()
+
+        stdio.assert_awaited_once()
+        assert client.http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_closed_when_serving_fails(self, no_warmup, stdio):
+        """Test the client is closed even if the transport raises"""
+        client = get_client()
+        stdio.side_effect = RuntimeError("transport failed")
+
+        with pytest.raises(RuntimeError):
+            await server._serve()
+
+        assert client.http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_uncreated_client_not_closed(self, no_warmup, stdio, monkeypatch):
+        """Test a client that was never created is not created just to close"""
+        aclose = AsyncMock()
+        monkeypatch.setattr(Gen3Client, "aclose", aclose)
+
+        await server._serve()
+
+        aclose.assert_not_awaited()
+        assert get_client.cache_info().currsize == 0
+
+
+class TestMain:
+    """Test the console entry point"""
+
+    @pytest.mark.parametrize(
+        "uvloop_module,expected_options",
+        [(Mock(), {"use_uvloop": True}), (None, {})],
+        ids=["uvloop_installed", "uvloop_missing"],
+    )
+    def test_event_loop_backend(self, monkeypatch, uvloop_module, expected_options):
+        """Test uvloop is requested from anyio only when it is importable"""
+        monkeypatch.setitem(sys.modules, "uvloop", uvloop_module)
+        run = Mock()
+        monkeypatch.setattr(server.anyio, "run", run)
+
+        server.main()
+
+        run.assert_called_once_with(server._serve, backend_options=expected_options)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from gen3_mcp.utils import suggest_similar_strings
+from gen3_mcp.utils import _suggest, suggest_similar_strings
 
 
 class TestSuggestSimilarStrings:
@@ -30,6 +30,27 @@ class TestSuggestSimilarStrings:
 
         assert "Subject" in suggestions
 
+    def test_caseless_unicode(self):
+        """Test matching uses full case folding, not just lowercasing."""
+        candidates = ["Straße", "Strand"]
+        suggestions = suggest_similar_strings("STRASSE", candidates, threshold=0.9)
+
+        assert suggestions == ["Straße"]
+
+    def test_similarity_compares_target_to_candidate(self):
+        """Test scores keep SequenceMatcher(None, target, candidate) order."""
+        # ratio() is 0.5 in this order but 0.25 with the strings swapped
+        suggestions = suggest_similar_strings("projet", ["experiment"], threshold=0.5)
+
+        assert suggestions == ["experiment"]
+
+    def test_ties_ordered_alphabetically(self):
+        """Test equally similar candidates come back in a stable order."""
+        candidates = ["abf", "abd", "abe", "abc"]
+        suggestions = suggest_similar_strings("ab", candidates, max_results=3)
+
+        assert suggestions == ["abc", "abd", "abe"]
+
     def test_threshold_filtering(self):
         """Test threshold filters out poor matches."""
         candidates = ["apple", "banana", "cherry"]
@@ -45,6 +66,32 @@ class TestSuggestSimilarStrings:
 
         assert len(suggestions) <= 2
 
+    def test_frozenset_candidates(self):
+        """Test a frozenset candidate pool can be reused across calls."""
+        candidates = frozenset(["Subject", "Study", "Sample", "Aliquot"])
+
+        assert suggest_similar_strings("subjct", candidates)[0] == "Subject"
+        assert suggest_similar_strings("sampel", candidates)[0] == "Sample"
+
+    def test_repeated_lookup_memoized(self):
+        """Test repeated lookups against the same pool reuse the result."""
+        candidates = frozenset(["subject", "study", "sample", "aliquot"])
+        _suggest.cache_clear()
+
+        first = suggest_similar_strings("subjct", candidates)
+        second = suggest_similar_strings("subjct", candidates)
+
+        assert first == second
+        assert first is not second  # callers get their own list
+        assert _suggest.cache_info().hits == 1
+
+    def test_duplicate_candidates(self):
+        """Test duplicate candidates are only suggested once."""
+        candidates = ["subject", "subject", "study"]
+        suggestions = suggest_similar_strings("subject", candidates)
+
+        assert suggestions.count("subject") == 1
+
     def test_empty_candidates(self):
         """Test behavior with empty candidates."""
         suggestions = suggest_similar_strings("test", [])